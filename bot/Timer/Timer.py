@@ -1,13 +1,25 @@
 import asyncio
 import datetime
 import logging
+import time
 import traceback
 import discord
-from enum import Enum
+from enum import Enum, IntEnum
+from operator import attrgetter
 
 from logger import log
 
 
+# Placeholder for the remaining time in cached pinned status templates
+REMAINING_SENTINEL = "\x00REMAINING\x00"
+
+# Name getter for TimerSubscribers
+_member_name = attrgetter('member.name')
+
+# Cached status embed timestamp, and the second it was generated for
+_last_ts_sec, _last_ts = 0, None
+
+
 class Timer(object):
     clock_period = 600
     max_warning = 1
@@ -17,6 +29,9 @@ class Timer(object):
         self.clock_channel = clock_channel
         self.role = role
         self.name = name
+
+        # Stage announcements may only ping the group role and the warned members
+        self._allowed_mentions = discord.AllowedMentions(everyone=False, users=True, roles=[role])
         self._truename = name
 
         self.start_time = None  # Session start time
@@ -32,6 +47,21 @@ class Timer(object):
         self.timer_messages = []  # List of sent message ids that this timer owns, e.g. for reaction handling
 
         self.last_clockupdate = 0
+        self._last_clock_name = None  # Last name successfully set on the clock channel
+
+        # Without a clock channel there is never anything to update
+        if clock_channel is None:
+            self.update_clock_channel = _noop_clock_update
+
+        self._stage_handle = None  # Scheduled handle for the next stage change
+
+        # Cached components of the pinned status message
+        self._pinstatus_template = None
+        self._subbed_cached = None
+        self._longest_stage_len = 0
+        self._last_pretty_sec = None  # Remaining time of the last `pretty_remaining` output
+        self._last_pretty_str = None
+        self._dirty = True  # Whether the pinned status changed since the last channel update
 
         if stages:
             self.setup(stages)
@@ -57,29 +87,36 @@ class Timer(object):
         self.remaining = stages[0].duration
         self.current_stage_start = now
 
+        self._prepare_stages()
+        self._build_status_template()
+
         # Return self for method chaining
         return self
 
     async def update_clock_channel(self, force=False):
         """
-        Try to update the name of the status channel with the current status
+        Try to update the name of the status channel with the current status.
+        Replaced by a no-op on timers constructed without a status channel.
         """
-        # Quit if there's no status channel set
-        if self.clock_channel is None:
-            return
-
         # Quit if we aren't due for a clock update yet
-        if not force and self.now() - self.last_clockupdate < self.clock_period:
+        now = self.now()
+        if not force and now - self.last_clockupdate < self.clock_period:
             return
 
         # Get the name and time strings
         stage_name = self.stages[self.current_stage].name
+        clock_name = "{} - {}".format(self.name, stage_name)
+
+        # Quit if the channel name wouldn't change, to save the ratelimited edit
+        if clock_name == self._last_clock_name:
+            return
 
         # Update the channel name, or quit silently if something goes wrong.
-        self.last_clockupdate = self.now()
+        self.last_clockupdate = now
         try:
-            await self.clock_channel.edit(name="{} - {}".format(self.name, stage_name))
+            await self.clock_channel.edit(name=clock_name)
             self.last_clockupdate = self.now()
+            self._last_clock_name = clock_name
         except Exception:
             pass
 
@@ -87,48 +124,93 @@ class Timer(object):
         """
         Return a formatted version of the time remaining until the next stage.
         """
-        return self.parse_dur(self.remaining, show_seconds=show_seconds)
+        self.update_remaining()
+        if show_seconds:
+            return self.parse_dur(self.remaining, show_seconds=True)
+
+        # Reuse the last string if the remaining time hasn't changed
+        if self.remaining != self._last_pretty_sec:
+            self._last_pretty_str = self.parse_dur(self.remaining)
+            self._last_pretty_sec = self.remaining
+        return self._last_pretty_str
 
     def pretty_pinstatus(self):
         """
         Return a formatted status string for use in the pinned status message.
         """
-        subbed_names = [m.member.name for m in self.subscribed.values()]
-        subbed_str = "```{}```".format(", ".join(subbed_names)) if subbed_names else "*No members*"
-
-        if self.state in [TimerState.RUNNING, TimerState.PAUSED]:
-            # Collect the component strings and data
-            current_stage_name = self.stages[self.current_stage].name
-            remaining = self.pretty_remaining()
-
-            # Create a list of lines for the stage string
-            longest_stage_len = max(len(stage.name) for stage in self.stages)
-            stage_format = "`{{prefix}}{{name:>{}}}:` {{dur}} min  {{current}}".format(longest_stage_len)
-
-            stage_str_lines = [
-                stage_format.format(
-                    prefix="->" if i == self.current_stage else "​  ",
-                    name=stage.name,
-                    dur=stage.duration,
-                    current="(**{}**)".format(remaining) if i == self.current_stage else ""
-                ) for i, stage in enumerate(self.stages)
-            ]
-            # Create the stage string itself
-            stage_str = "\n".join(stage_str_lines)
-
-            # Create the final formatted status string
-            status_str = ("**{name}**: {current_stage_name} {paused}\n"
-                          "{stage_str}\n"
-                          "{subbed_str}").format(name=self.name,
-                                                 role=self.role.mention,
-                                                 paused=" ***Paused***" if self.state == TimerState.PAUSED else "",
-                                                 current_stage_name=current_stage_name,
-                                                 stage_str=stage_str,
-                                                 subbed_str=subbed_str)
+        if self.state != TimerState.STOPPED:
+            # Build the status template if it was invalidated
+            if self._pinstatus_template is None:
+                self._build_status_template()
+
+            # Only the remaining time changes between template rebuilds
+            status_str = self._pinstatus_template.replace(REMAINING_SENTINEL, self.pretty_remaining())
         elif self.state == TimerState.STOPPED:
-            status_str = "**{}**: *Timer not running.*\n{}".format(self.name, subbed_str)
+            status_str = "**{}**: *Timer not running.*\n{}".format(self.name, self._subbed_str())
         return status_str
 
+    def _subbed_str(self):
+        """
+        Return the cached subscriber list string for the pinned status message.
+        """
+        if self._subbed_cached is None:
+            if self.subscribed:
+                self._subbed_cached = f"```{', '.join(map(_member_name, self.subscribed.values()))}```"
+            else:
+                self._subbed_cached = "*No members*"
+        return self._subbed_cached
+
+    def _build_status_template(self):
+        """
+        Build and cache the fully rendered pinned status message.
+        The current stage's remaining time is left as `REMAINING_SENTINEL`, to be replaced by `pretty_pinstatus`.
+        """
+        # Create a list of lines for the stage string
+        stage_lines = [
+            "`{}{}:` {} min  {}".format(
+                "->" if i == self.current_stage else "​  ",
+                stage._name_padded,
+                stage.duration,
+                "(**{}**)".format(REMAINING_SENTINEL) if i == self.current_stage else ""
+            ) for i, stage in enumerate(self.stages)
+        ]
+
+        # Create the status template itself
+        self._pinstatus_template = ("**{name}**: {current_stage_name} {paused}\n"
+                                    "{stage_str}\n"
+                                    "{subbed_str}").format(
+                                        name=self.name,
+                                        current_stage_name=self.stages[self.current_stage].name,
+                                        paused=" ***Paused***" if self.state == TimerState.PAUSED else "",
+                                        stage_str="\n".join(stage_lines),
+                                        subbed_str=self._subbed_str()
+                                    )
+
+    def _prepare_stages(self):
+        """
+        Precompute the per-stage formatting data for the pinned status message.
+        Must be called whenever `stages` is replaced.
+        """
+        self._longest_stage_len = max(len(stage.name) for stage in self.stages)
+        for stage in self.stages:
+            stage._name_padded = stage.name.rjust(self._longest_stage_len)
+
+    def invalidate_status(self):
+        """
+        Invalidate the cached pinned status template.
+        Must be called when the name, state, stages or current stage change.
+        """
+        self._pinstatus_template = None
+        self._dirty = True
+
+    def subscribers_changed(self):
+        """
+        Notify the timer that its subscriber list has been modified.
+        """
+        self._subbed_cached = None
+        self._pinstatus_template = None
+        self._dirty = True
+
     def pretty_summary(self):
         """
         Return a short summary status message.
@@ -172,7 +254,7 @@ class Timer(object):
             status = "Stopped"
 
         if self.stages:
-            stage_str = "/".join(str(stage.duration) for i, stage in enumerate(self.stages))
+            stage_str = "/".join([str(stage.duration) for stage in self.stages])
         else:
             stage_str = "not set up"
 
@@ -191,20 +273,26 @@ class Timer(object):
         current_stage = self.stages[self.current_stage]
         new_stage = self.stages[stage_index]
 
+        now = self.now()
         self.current_stage = stage_index
-        self.current_stage_start = self.now()
-        self.remaining = self.stages[stage_index].duration * 60
+        self.current_stage_start = now
+        self.remaining = new_stage.duration_s
+        self.invalidate_status()
+
+        if self.state == TimerState.RUNNING:
+            self.schedule_stage_change()
 
         # Update clocked times for all the subbed users and handle inactivity
         needs_warning = []
         unsubs = []
+        inactive_after = current_stage.duration_s
         for subber in self.subscribed.values():
-            subber.touch()
+            subber.touch(now)
             if inactivity_check:
                 if subber.warnings >= self.max_warning:
                     subber.warnings += 1
                     unsubs.append(subber)
-                elif (self.now() - subber.last_seen) > current_stage.duration * 60:
+                elif (now - subber.last_seen) > inactive_after:
                     subber.warnings += 1
                     if subber.warnings >= self.max_warning:
                         needs_warning.append(subber)
@@ -229,12 +317,7 @@ class Timer(object):
             else:
                 unsub_str = ""
 
-            main_line = "{}Starting **{}** ({} minutes). {}".format(
-                old_stage_str,
-                new_stage.name,
-                new_stage.duration,
-                new_stage.message
-            )
+            main_line = old_stage_str + new_stage._announce
 
             if not empty:
                 out_msg = await self.channel.send(
@@ -244,12 +327,11 @@ class Timer(object):
                          main_line,
                          warning_str,
                          unsub_str
-                     )
+                     ),
+                    allowed_mentions=self._allowed_mentions
                 )
-                try:
-                    await out_msg.add_reaction("✅")
-                except Exception:
-                    pass
+                # Add the reaction in the background, so it doesn't hold up the stage change
+                asyncio.ensure_future(_quietly(out_msg.add_reaction("✅")))
 
                 # Add the stage message to the owned message list
                 self.timer_messages.append(out_msg.id)
@@ -268,17 +350,19 @@ class Timer(object):
                 pass
 
             # Notify the subscribers as desired
+            unsub_set = set(unsubs)
+            warning_set = set(needs_warning)
             for subber in self.subscribed.values():
                 try:
                     out_msg = None
-                    if subber in unsubs and subber.notify >= NotifyLevel.FINAL:
+                    if subber in unsub_set and subber.notify >= NotifyLevel.FINAL:
                         await subber.member.send(
                             "You have been unsubscribed from group **{}** in {} due to inactivity!".format(
                                 self.name,
                                 self.channel.mention
                             )
                         )
-                    elif subber in needs_warning and subber.notify >= NotifyLevel.WARNING:
+                    elif subber in warning_set and subber.notify >= NotifyLevel.WARNING:
                         out_msg = await subber.member.send(
                             ("**Warning** from group **{}** in {}!\n"
                              "Please respond or react to a timer message "
@@ -308,38 +392,72 @@ class Timer(object):
         """
         await self.change_stage(0, report_old=False)
         self.state = TimerState.RUNNING
+        self.invalidate_status()
+        now = self.now()
         for subber in self.subscribed.values():
-            subber.touch()
+            subber.touch(now)
             subber.active = True
 
-        asyncio.ensure_future(self.runloop())
+        self.schedule_stage_change()
 
     def stop(self):
         """
         Stop the timer, and ensure the subscriber clocked times are updated.
         """
+        now = self.now()
         for subber in self.subscribed.values():
-            subber.touch()
+            subber.touch(now)
             subber.active = False
 
         self.state = TimerState.STOPPED
+        self.invalidate_status()
 
-    async def runloop(self):
-        while self.state == TimerState.RUNNING:
-            self.remaining = int(60*self.stages[self.current_stage].duration - (self.now() - self.current_stage_start))
-            if self.remaining <= 0:
-                try:
-                    await self.change_stage(self.current_stage + 1)
-                    asyncio.ensure_future(self.update_clock_channel(force=True))
-                except Exception:
-                    full_traceback = traceback.format_exc()
-                    log("Exception encountered while changing stage.\n{}".format(full_traceback),
-                        context="TIMER_RUNLOOP",
-                        level=logging.ERROR)
+        if self._stage_handle is not None:
+            self._stage_handle.cancel()
+            self._stage_handle = None
 
-            # Disable clock update since the channel update ratelimit is too slow
-            # asyncio.ensure_future(self.update_clock_channel())
-            await asyncio.sleep(1)
+    def update_remaining(self):
+        """
+        Recalculate the time remaining in the current stage, if the timer is running.
+        """
+        if self.state == TimerState.RUNNING:
+            self.remaining = int(self.stages[self.current_stage].duration_s - (self.now() - self.current_stage_start))
+
+    def schedule_stage_change(self):
+        """
+        Schedule the next stage change at the absolute end of the current stage.
+        Replaces any previously scheduled stage change.
+        """
+        if self._stage_handle is not None:
+            self._stage_handle.cancel()
+
+        loop = asyncio.get_event_loop()
+        stage_deadline = self.current_stage_start + self.stages[self.current_stage].duration_s
+        self._stage_handle = loop.call_at(
+            loop.time() + max(stage_deadline - self.now(), 0),
+            lambda: asyncio.ensure_future(self._next_stage())
+        )
+
+    async def _next_stage(self):
+        """
+        Advance to the next stage, as scheduled by `schedule_stage_change`.
+        """
+        self._stage_handle = None
+        if self.state != TimerState.RUNNING:
+            return
+
+        try:
+            await self.change_stage(self.current_stage + 1)
+            asyncio.ensure_future(self.update_clock_channel(force=True))
+        except Exception:
+            full_traceback = traceback.format_exc()
+            log("Exception encountered while changing stage.\n{}".format(full_traceback),
+                context="TIMER_RUNLOOP",
+                level=logging.ERROR)
+
+            # Make sure the timer keeps running
+            if self.state == TimerState.RUNNING and self._stage_handle is None:
+                self.schedule_stage_change()
 
     @staticmethod
     def now():
@@ -356,20 +474,19 @@ class Timer(object):
         diff = max(diff, 0)
         if show_seconds:
             diff = int(60 * round(diff / 60))
-            hours = diff // 3600
-            minutes = (diff % 3600) // 60
-            return "{:02d}:{:02d}".format(hours, minutes)
+            hours, rem = divmod(diff, 3600)
+            return f"{hours:02d}:{rem // 60:02d}"
         else:
-            hours = diff // 3600
-            minutes = (diff % 3600) // 60
-            seconds = diff % 60
-            return "{:02d}:{:02d}:{:02d}".format(hours, minutes, seconds)
+            hours, rem = divmod(diff, 3600)
+            minutes, seconds = divmod(rem, 60)
+            return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
     def serialise(self):
         """
         Serialise current timer status to a dictionary.
         Does not serialise subscribers or fixed attributes such as channels.
         """
+        self.update_remaining()
         return {
             'roleid': self.role.id,
             'name': self.name,
@@ -396,12 +513,48 @@ class Timer(object):
         ] if data['stages'] else None
         self.current_stage = data.get('current_stage', 0)
         self.timer_messages = data.get('messages', [])
+        if self.stages:
+            self._prepare_stages()
+        self.invalidate_status()
 
-        asyncio.ensure_future(self.runloop())
+        if self.state == TimerState.RUNNING:
+            self.schedule_stage_change()
         return self
 
 
-class TimerState(Enum):
+def _embed_timestamp():
+    """
+    Return the current UTC time to the second, for use as a status embed timestamp.
+    Reuses the previous datetime when called again within the same second.
+    """
+    global _last_ts_sec, _last_ts
+
+    now_s = int(time.time())
+    if now_s != _last_ts_sec:
+        _last_ts = datetime.datetime.utcfromtimestamp(now_s)
+        _last_ts_sec = now_s
+    return _last_ts
+
+
+async def _quietly(coro):
+    """
+    Await the given coroutine, silently discarding any exception.
+    For best-effort requests run in the background.
+    """
+    try:
+        await coro
+    except Exception:
+        pass
+
+
+async def _noop_clock_update(force=False):
+    """
+    Stand-in for `Timer.update_clock_channel` on timers without a clock channel.
+    """
+    pass
+
+
+class TimerState(IntEnum):
     """
     Enum representing the current running state of the timer.
     STOPPED: The timer either hasn't been set up, or has been stopped externally.
@@ -423,6 +576,7 @@ class TimerStage(object):
         The human readable name of the stage.
     duration: int
         The number of minutes the stage lasts for.
+        The equivalent number of seconds is stored as `duration_s`.
     message: str
         An optional message to send when starting this stage.
     focus: bool
@@ -430,17 +584,24 @@ class TimerStage(object):
     modifiers: Dict(str, bool)
         An unspecified collection of stage modifiers, stored for external use.
     """
-    __slots__ = ('name', 'message', 'duration', 'focus', 'modifiers')
+    __slots__ = ('name', 'message', 'duration', 'duration_s', 'focus', 'modifiers', '_name_padded', '_announce')
 
     def __init__(self, name, duration, message="", focus=False, **modifiers):
         self.name = name
         self.duration = duration
+        self.duration_s = duration * 60
         self.message = message
 
         self.focus = focus
 
         self.modifiers = modifiers
 
+        # Name padded to the longest stage name of the owning timer, set by `Timer.setup`
+        self._name_padded = name
+
+        # Stage start announcement line
+        self._announce = "Starting **{}** ({} minutes). {}".format(name, duration, message)
+
     def serialise(self):
         """
         Serialise stage to a serialisable dictionary.
@@ -481,7 +642,7 @@ class TimerChannel(object):
         A valid and current discord Message in the channel.
         Holds the updating timer status messages.
     """
-    __slots__ = ('channel', 'timers', 'msg', 'old_desc')
+    __slots__ = ('channel', 'timers', 'msg', 'old_desc', '_dirty')
 
     def __init__(self, channel):
         self.channel = channel
@@ -490,11 +651,19 @@ class TimerChannel(object):
         self.msg = None
 
         self.old_desc = ""
+        self._dirty = True  # Whether the timer list changed since the last status update
 
     async def update(self):
         """
         Create or update the channel status message.
+        Only updates when a timer is running or has changed since the last update.
         """
+        if not self.needs_update():
+            return
+
+        # Clear the dirty flags before rendering, so changes made while the update is in flight are kept
+        changed = self._mark_clean()
+
         messages = [timer.pretty_pinstatus() for timer in self.timers]
         if messages:
             desc = "\n\n".join(messages)
@@ -502,22 +671,23 @@ class TimerChannel(object):
             # Don't resend the same message
             if desc == self.old_desc:
                 return
-            self.old_desc = desc
 
             embed = discord.Embed(
                 title="Pomodoro Timer Status",
                 description=desc,
-                timestamp=datetime.datetime.utcnow()
+                timestamp=_embed_timestamp()
             )
             if self.msg is not None:
                 try:
                     await self.msg.edit(embed=embed)
+                    self.old_desc = desc
                 except discord.NotFound:
                     self.msg = None
+                    self._mark_dirty(changed)
                 except discord.Forbidden:
-                    pass
+                    self._mark_dirty(changed)
                 except Exception:
-                    pass
+                    self._mark_dirty(changed)
 
                 """
                 if all(timer.state == TimerState.STOPPED for timer in self.timers):
@@ -534,6 +704,7 @@ class TimerChannel(object):
                 try:
                     # Send a new message
                     self.msg = await self.channel.send(embed=embed)
+                    self.old_desc = desc
 
                     # Pin the message
                     try:
@@ -541,6 +712,7 @@ class TimerChannel(object):
                     except Exception:
                         pass
                 except discord.Forbidden:
+                    self._mark_dirty(changed)
                     try:
                         await self.channel.send(
                             "I require permission to send embeds in this channel! "
@@ -553,11 +725,47 @@ class TimerChannel(object):
                     for timer in self.timers:
                         timer.stop()
                 except discord.NotFound:
+                    self._mark_dirty(changed)
                     # The channel doesn't even exist anymore! Stop all timers so we don't try to post anymore.
                     # TODO: Handle garbage collection, cautiously because this might be an outage
                     for timer in self.timers:
                         timer.stop()
 
+    def timers_changed(self):
+        """
+        Notify the channel that timers have been added or removed.
+        """
+        self._dirty = True
+
+    def needs_update(self):
+        """
+        Whether the timer list or any bound timer has changed, or a timer is running, since the last status update.
+        """
+        return self._dirty or any(timer._dirty or timer.state == TimerState.RUNNING for timer in self.timers)
+
+    def _mark_clean(self):
+        """
+        Mark the channel and its bound timers as up to date with the channel status message.
+        Returns the cleared flags, to be restored with `_mark_dirty` if the update fails.
+        """
+        changed = (self._dirty, [timer for timer in self.timers if timer._dirty])
+
+        self._dirty = False
+        for timer in self.timers:
+            timer._dirty = False
+
+        return changed
+
+    def _mark_dirty(self, changed):
+        """
+        Restore the dirty flags cleared by `_mark_clean`, after a failed update.
+        """
+        channel_dirty, timers = changed
+
+        self._dirty = self._dirty or channel_dirty
+        for timer in timers:
+            timer._dirty = True
+
 
 class NotifyLevel(Enum):
     """
@@ -635,11 +843,12 @@ class TimerSubscriber(object):
         self.last_seen = Timer.now()
         self.warnings = 0
 
-    def touch(self):
+    def touch(self, now=None):
         """
         Update the clocked time based on the active status.
+        Accepts a precomputed `now` timestamp, so a timer may touch all its subscribers with one clock sample.
         """
-        now = Timer.now()
+        now = now if now is not None else Timer.now()
         self.clocked_time += (now - self.last_updated) if self.active else 0
         self.last_updated = now
 
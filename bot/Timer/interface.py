@@ -13,16 +13,19 @@ from logger import log
 from .trackers import message_tracker, reaction_tracker
 from .Timer import Timer, TimerChannel, TimerSubscriber, TimerStage, NotifyLevel, TimerState
 from .registry import TimerRegistry
+from .scheduler import UpdateScheduler
 from .voice import sub_on_vcjoin
 
 
 class TimerInterface(object):
     save_interval = 120
+    update_interval = 60
     save_fp = "data/timerstatus.json"
 
     def __init__(self, client, db_filename):
         self.client = client
         self.registry = TimerRegistry(db_filename)
+        self.scheduler = UpdateScheduler()
 
         self.guild_channels = {}
         self.channels = {}
@@ -66,16 +69,16 @@ class TimerInterface(object):
 
     async def updateloop(self):
         while True:
-            channels = self.channels.values()
-            delay = max((0.1, 60/len(channels)))
-
-            for tchan in channels:
-                asyncio.ensure_future(tchan.update())
-                await asyncio.sleep(delay)
+            # Update in the background, so a ratelimited edit doesn't hold up saving or the next round
+            asyncio.ensure_future(
+                self.scheduler.flush([tchan for tchan in self.channels.values() if tchan.needs_update()])
+            )
 
             if Timer.now() - self.last_save > self.save_interval:
                 self.update_save()
 
+            await asyncio.sleep(self.update_interval)
+
     def load_timers(self):
         client = self.client
 
@@ -166,6 +169,7 @@ class TimerInterface(object):
                     subber = TimerSubscriber.deserialise(member, timer, self, sub_data)
                     self.subscribers[(member.guild.id, member.id)] = subber
                     timer.subscribed[member.id] = subber
+                    timer.subscribers_changed()
 
                     log("Restored subscriber {} (id {}) in timer {} (roleid {}) from save.".format(member.name,
                                                                                                    member.id,
@@ -319,6 +323,7 @@ class TimerInterface(object):
         tchan = self.channels.get(timer.channel.id, None)
         if tchan is not None:
             tchan.timers.remove(timer)
+            tchan.timers_changed()
             # Cleanup if the channel has no remaining timers
             if len(tchan.timers) == 0:
                 self.channels.pop(timer.channel.id)
@@ -397,6 +402,7 @@ class TimerInterface(object):
             await ctx.error_reply("Group role `{}` doesn't exist! This group is broken.".format(timer.role.id))
 
         timer.subscribed[member.id] = subber
+        timer.subscribers_changed()
         self.subscribers[(member.guild.id, member.id)] = subber
 
     async def unsub(self, guildid, userid):
@@ -412,6 +418,7 @@ class TimerInterface(object):
 
             self.subscribers.pop((guildid, userid))
             subber.timer.subscribed.pop(userid)
+            subber.timer.subscribers_changed()
 
             try:
                 await subber.member.remove_roles(subber.timer.role)
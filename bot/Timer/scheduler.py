@@ -0,0 +1,45 @@
+import asyncio
+import logging
+import traceback
+
+from logger import log
+
+
+class UpdateScheduler(object):
+    """
+    Updates batches of TimerChannels concurrently.
+
+    Parameters
+    ----------
+    max_concurrent: int
+        The maximum number of channel updates allowed in flight at once.
+        Keeps the burst of status edits well under the global request ratelimit.
+    """
+    def __init__(self, max_concurrent=10):
+        self.max_concurrent = max_concurrent
+
+        self._semaphore = None
+
+    async def flush(self, tchans):
+        """
+        Update the given TimerChannels concurrently, logging any exceptions raised.
+        """
+        if not tchans:
+            return
+
+        # Create the semaphore lazily, so it binds to the running loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        results = await asyncio.gather(*(self._update(tchan) for tchan in tchans), return_exceptions=True)
+        for tchan, result in zip(tchans, results):
+            if isinstance(result, Exception):
+                full_traceback = "".join(traceback.format_exception(type(result), result, result.__traceback__))
+                log("Exception encountered while updating timer channel (cid: {}).\n{}".format(tchan.channel.id,
+                                                                                              full_traceback),
+                    context="TIMER_UPDATE",
+                    level=logging.ERROR)
+
+    async def _update(self, tchan):
+        async with self._semaphore:
+            await tchan.update()
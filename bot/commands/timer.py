@@ -469,6 +469,7 @@ async def cmd_rename(ctx):
             "**Usage:** `rename <groupname>`"
         )
     timer.name = ctx.arg_str
+    timer.invalidate_status()
     await ctx.embedreply("Your group has been renamed to **{}**.".format(ctx.arg_str))
 
 
@@ -517,15 +518,17 @@ async def cmd_syncwith(ctx):
     elapsed = 0
     while elapsed < target_duration:
         i = (i + 1) % len(current_timer.stages)
-        elapsed += current_timer.stages[i].duration * 60
+        elapsed += current_timer.stages[i].duration_s
 
     # Calculate new stage start
-    new_stage_start = sync_timer.now() - (current_timer.stages[i].duration * 60 - (elapsed - target_duration))
+    new_stage_start = sync_timer.now() - (current_timer.stages[i].duration_s - (elapsed - target_duration))
 
     # Change the stage and adjust the time
     await current_timer.change_stage(i, notify=False, inactivity_check=False, report_old=False)
     current_timer.current_stage_start = new_stage_start
     current_timer.remaining = elapsed - target_duration
+    if current_timer.state == TimerState.RUNNING:
+        current_timer.schedule_stage_change()
 
     # Notify the user
     await ctx.embedreply(current_timer.pretty_pinstatus(), title="Timers synced!")